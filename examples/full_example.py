@@ -4,6 +4,11 @@ from dotenv import load_dotenv
 
 from src.maximus import MaxClient
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 load_dotenv()
 
 
@@ -61,4 +66,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop is optional: fall back to the default asyncio loop when missing
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
\ No newline at end of file
@@ -1,9 +1,21 @@
 import asyncio
-from typing import Optional, Callable, Union, Dict, Any
+import logging
+from typing import Optional, Callable, Union, Dict, Any, List
 from ..errors import AuthError
 from .interfaces import IConnection, ISessionManager
 from .constants import DEFAULT_CHATS_COUNT, AUTH_DELAY, AUTH_TIMEOUT, Messages
 
+logger = logging.getLogger("maximus.auth")
+
+
+def _nav_events(loop: asyncio.AbstractEventLoop) -> List[Dict[str, Any]]:
+    """Build navigation events sent after auth start, sharing one timestamp."""
+    time_ms = int(loop.time() * 1000)
+    return [
+        {"type": "COLD_START", "time": time_ms},
+        {"type": "GO", "page": 1, "time": time_ms}
+    ]
+
 
 class AuthManager:
     """Authentication manager."""
@@ -33,34 +45,35 @@ class AuthManager:
         """Authenticate user."""
         token = self._session.get("token")
         if token:
-            print(Messages.FOUND_TOKEN)
+            logger.info(Messages.FOUND_TOKEN)
             await asyncio.sleep(AUTH_DELAY)
             await self._connection.send_auth_token(token, interactive=False, chats_count=DEFAULT_CHATS_COUNT)
-            print(Messages.TOKEN_SENT)
+            logger.info(Messages.TOKEN_SENT)
             self._auth_future = asyncio.Future()
             await self._auth_future
             return
         
         if phone:
-            print(Messages.PHONE_SENDING.format(phone))
+            logger.info(Messages.PHONE_SENDING, phone)
             self._phone = phone
             self._session.set("phone", phone)
             await self._session.save()
             self._code_callback = code_callback
-            await self._connection.send_auth_start(phone, "ru")
-            print(Messages.PHONE_SENT)
-            
-            # Send navigation events
-            events = [
-                {"type": "COLD_START", "time": int(asyncio.get_event_loop().time() * 1000)},
-                {"type": "GO", "page": 1, "time": int(asyncio.get_event_loop().time() * 1000)}
-            ]
-            await self._connection.send_events(events)
-            print(Messages.NAVIGATION_EVENTS_SENT)
+            await self._send_auth_start(phone)
+            logger.info(Messages.PHONE_SENT)
+            logger.info(Messages.NAVIGATION_EVENTS_SENT)
             
             self._auth_future = asyncio.Future()
             await self._auth_future
     
+    async def _send_auth_start(self, phone: str) -> None:
+        """Send auth start and the navigation events that follow it."""
+        # gather() starts the sends in argument order, so auth start is still written first
+        await asyncio.gather(
+            self._connection.send_auth_start(phone, "ru"),
+            self._connection.send_events(_nav_events(asyncio.get_running_loop()))
+        )
+    
     async def _on_auth_success(self, payload: Dict[str, Any]) -> None:
         """Handle auth success."""
         new_token = payload.get("token")
@@ -74,15 +87,15 @@ class AuthManager:
     async def _on_auth_code_requested(self, payload: Dict[str, Any]) -> None:
         """Handle auth code request."""
         token = payload.get("token")
-        print(Messages.CODE_REQUESTED)
+        logger.info(Messages.CODE_REQUESTED)
         if self._code_callback:
             code = self._code_callback()
             if asyncio.iscoroutine(code):
                 code = await code
             if code:
-                print(Messages.SENDING_CODE)
+                logger.info(Messages.SENDING_CODE)
                 await self._connection.send_auth_code(token, code)
-                print(Messages.CODE_SENT)
+                logger.info(Messages.CODE_SENT)
     
     async def _on_auth_code_checked(self, payload: Dict[str, Any]) -> None:
         """Handle auth code check."""
@@ -90,44 +103,38 @@ class AuthManager:
         login_token = token_attrs.get("LOGIN", {}).get("token")
         
         if login_token:
-            print(Messages.CODE_VERIFIED)
+            logger.info(Messages.CODE_VERIFIED)
             self._session.set("token", login_token)
             await self._session.save()
-            print(Messages.TOKEN_SAVED)
-            print(Messages.SENDING_TOKEN)
+            logger.info(Messages.TOKEN_SAVED)
+            logger.info(Messages.SENDING_TOKEN)
             await self._connection.send_auth_token(login_token, interactive=False, chats_count=DEFAULT_CHATS_COUNT)
-            print(Messages.TOKEN_SENT)
+            logger.info(Messages.TOKEN_SENT)
     
     async def _on_auth_error(self, payload: Dict[str, Any]) -> None:
         """Handle auth error."""
         error = payload.get("error")
         message = payload.get("message")
         
-        print(Messages.AUTH_ERROR.format(message))
+        logger.error(Messages.AUTH_ERROR, message)
         
         if error == "login.token" or message == "FAIL_LOGIN_TOKEN":
-            print(Messages.TOKEN_INVALID)
+            logger.warning(Messages.TOKEN_INVALID)
             self._session.set("token", None)
             await self._session.save()
             
             if self._phone:
-                print(Messages.REQUESTING_REAUTH)
-                await self._connection.send_auth_start(self._phone, "ru")
-                
-                events = [
-                    {"type": "COLD_START", "time": int(asyncio.get_event_loop().time() * 1000)},
-                    {"type": "GO", "page": 1, "time": int(asyncio.get_event_loop().time() * 1000)}
-                ]
-                await self._connection.send_events(events)
+                logger.info(Messages.REQUESTING_REAUTH)
+                await self._send_auth_start(self._phone)
                 
                 self._auth_future = asyncio.Future()
                 try:
                     await asyncio.wait_for(self._auth_future, timeout=AUTH_TIMEOUT)
-                    print(Messages.REAUTH_SUCCESSFUL)
+                    logger.info(Messages.REAUTH_SUCCESSFUL)
                 except asyncio.TimeoutError:
-                    print(Messages.AUTH_TIMEOUT)
+                    logger.warning(Messages.AUTH_TIMEOUT)
             else:
-                print(Messages.PHONE_NOT_FOUND)
+                logger.warning(Messages.PHONE_NOT_FOUND)
                 if self._auth_future and not self._auth_future.done():
                     self._auth_future.set_exception(AuthError("Phone number not found"))
         else:
@@ -140,10 +147,10 @@ class AuthManager:
         message = payload.get("message")
         localized_message = payload.get("localizedMessage", message)
         
-        print(Messages.AUTH_CODE_ERROR.format(localized_message))
+        logger.error(Messages.AUTH_CODE_ERROR, localized_message)
         
         if error == "error.limit.violate":
-            print(Messages.TOO_MANY_ATTEMPTS)
+            logger.warning(Messages.TOO_MANY_ATTEMPTS)
         
         if self._auth_future and not self._auth_future.done():
             self._auth_future.set_exception(AuthError(f"Auth code error: {localized_message}"))
\ No newline at end of file
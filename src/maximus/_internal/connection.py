@@ -1,6 +1,10 @@
 import asyncio
+import itertools
 import json
-from typing import Optional, Callable, Dict, Any, List, Protocol
+import logging
+import time
+from collections import defaultdict
+from typing import Optional, Callable, Dict, Any, List, Protocol, DefaultDict, Tuple
 from contextlib import asynccontextmanager
 
 try:
@@ -10,9 +14,80 @@ except ImportError:
     websockets = None
     ConnectionClosed = Exception
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..errors.connection import ConnectionError
 from .interfaces import IConnection
-from .constants import WEBSOCKET_URL, DEFAULT_CHATS_COUNT, Messages, call_handlers
+from .constants import (
+    WEBSOCKET_URL, DEFAULT_CHATS_COUNT, Messages, HandlerEntry, call_handlers_concurrently,
+    classify_handler,
+)
+
+logger = logging.getLogger("maximus.connection")
+
+# Envelope fields are plain ints, so only the payload needs a real JSON encoder
+_ENVELOPE_PREFIX = '{"ver":%d,"cmd":%d,"seq":%d,"opcode":%d,"payload":'
+_ENVELOPE_PREFIX_BYTES = _ENVELOPE_PREFIX.encode()
+
+_STATIC_HEADERS = {
+    "Origin": "https://web.max.ru",
+    "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache"
+}
+
+# Fixed part of the auth token payload: always request a full initial sync
+_AUTH_TOKEN_SYNC = {
+    "chatsSync": 0,
+    "contactsSync": 0,
+    "presenceSync": 0,
+    "draftsSync": 0
+}
+
+# (cmd, opcode) of an incoming frame -> internal event name; either may be missing from a frame
+_EVENT_TABLE: Dict[Tuple[Optional[int], Optional[int]], str] = {
+    (1, 19): "auth_success",
+    (1, 17): "auth_code_requested",
+    (1, 18): "auth_code_checked",
+    (1, 64): "message_sent",
+    (1, 32): "contacts_update",
+    (1, 48): "chats_update",
+    (3, 19): "auth_error",
+    (3, 17): "auth_code_error",
+    (0, 128): "new_message",
+}
+
+
+def _encode_message(message: Dict[str, Any]) -> str:
+    """Serialize a protocol message by splicing its payload into the envelope."""
+    fields = (message["ver"], message["cmd"], message["seq"], message["opcode"])
+    if orjson:
+        return (_ENVELOPE_PREFIX_BYTES % fields + orjson.dumps(message["payload"]) + b"}").decode()
+    return _ENVELOPE_PREFIX % fields + json.dumps(message["payload"]) + "}"
+
+
+class LazyJson:
+    """Pretty-print a message only when the log record is actually rendered."""
+    
+    __slots__ = ("_obj",)
+    
+    def __init__(self, obj: Any) -> None:
+        self._obj = obj
+    
+    def __str__(self) -> str:
+        return json.dumps(self._obj, indent=2, ensure_ascii=False)
+
+
+def _enable_debug_logging() -> None:
+    """Show all library log records, attaching a stderr handler if none is configured."""
+    package_logger = logging.getLogger("maximus")
+    package_logger.setLevel(logging.DEBUG)
+    if not package_logger.hasHandlers():
+        package_logger.addHandler(logging.StreamHandler())
 
 
 class ConnectionAdapter(Protocol):
@@ -38,9 +113,11 @@ class ConnectionAdapter(Protocol):
 class WebSocketConnection:
     """WebSocket connection implementation."""
     
-    def __init__(self) -> None:
+    def __init__(self, compression: Optional[str] = None) -> None:
         self._websocket: Optional[Any] = None
         self._is_connected = False
+        # Protocol frames are small JSON, so permessage-deflate costs more CPU than it saves
+        self._compression = compression
     
     async def connect(self, url: str, headers: Dict[str, str]) -> None:
         """Connect to WebSocket."""
@@ -48,7 +125,9 @@ class WebSocketConnection:
             raise ConnectionError("websockets library not installed")
         
         try:
-            self._websocket = await websockets.connect(url, extra_headers=headers)
+            self._websocket = await websockets.connect(
+                url, extra_headers=headers, compression=self._compression
+            )
             self._is_connected = True
         except Exception as e:
             raise ConnectionError(f"Failed to connect: {e}")
@@ -94,19 +173,35 @@ class MaxConnection(IConnection):
         self._connection = connection
         self._session_data = session_data
         self._debug = debug
-        self._seq = 0
-        self._message_handlers: Dict[str, List[Callable]] = {}
+        self._next_seq = itertools.count(1).__next__
+        self._message_handlers: DefaultDict[str, List[HandlerEntry]] = defaultdict(list)
+        self._listen_task: Optional[asyncio.Task] = None
+        # Set by disconnect() so a deliberate close doesn't fire "closed" handlers
+        self._closing = False
+        
+        # Session data is a snapshot, so these never change for this connection
+        self._headers = self._build_headers()
+        self._user_agent_dict = self._build_user_agent_dict()
+        
+        if debug:
+            _enable_debug_logging()
     
     async def connect(self) -> None:
         """Connect to MAX API."""
-        headers = self._get_headers()
-        await self._connection.connect(WEBSOCKET_URL, headers)
+        self._closing = False
+        await self._connection.connect(WEBSOCKET_URL, self._headers)
         await self._initialize()
-        asyncio.create_task(self._listen())
+        self._listen_task = asyncio.create_task(self._listen())
     
     async def disconnect(self) -> None:
         """Disconnect from MAX API."""
+        self._closing = True
         await self._connection.close()
+        # Called from an event handler, the listener is the current task; it exits on its own
+        task = self._listen_task
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+        self._listen_task = None
     
     def is_connected(self) -> bool:
         """Check if connected."""
@@ -114,14 +209,11 @@ class MaxConnection(IConnection):
     
     def register_event_handler(self, event: str, handler: Callable) -> None:
         """Register internal event handler."""
-        if event not in self._message_handlers:
-            self._message_handlers[event] = []
-        self._message_handlers[event].append(handler)
+        self._message_handlers[event].append(classify_handler(handler))
     
     async def send_message(self, chat_id: int, text: str, reply_to: Optional[str] = None) -> int:
         """Send a message."""
-        import time
-        cid = int(time.time() * 1000)
+        cid = time.time_ns() // 1_000_000
         
         message_data = {
             "text": text,
@@ -140,13 +232,11 @@ class MaxConnection(IConnection):
         }
         
         message = self._create_message(64, payload)
-        await self._send(message)
-        return self._seq
+        return await self._send(message)
     
     async def send_sticker(self, chat_id: int, sticker_id: int, reply_to: Optional[str] = None) -> int:
         """Send a sticker."""
-        import time
-        cid = int(time.time() * 1000)
+        cid = time.time_ns() // 1_000_000
         
         message_data = {
             "cid": cid,
@@ -166,8 +256,7 @@ class MaxConnection(IConnection):
         }
         
         message = self._create_message(64, payload)
-        await self._send(message)
-        return self._seq
+        return await self._send(message)
     
     async def send_reaction(self, chat_id: int, message_id: str, reaction_type: str = "EMOJI", reaction_id: str = "👍") -> int:
         """Send a reaction."""
@@ -181,8 +270,7 @@ class MaxConnection(IConnection):
         }
         
         message = self._create_message(178, payload)
-        await self._send(message)
-        return self._seq
+        return await self._send(message)
     
     async def edit_message(self, chat_id: int, message_id: str, text: str) -> int:
         """Edit a message."""
@@ -192,8 +280,7 @@ class MaxConnection(IConnection):
             "text": text
         }
         message = self._create_message(21, payload)
-        await self._send(message)
-        return self._seq
+        return await self._send(message)
     
     async def delete_message(self, chat_id: int, message_id: str) -> int:
         """Delete a message."""
@@ -202,15 +289,13 @@ class MaxConnection(IConnection):
             "messageId": message_id
         }
         message = self._create_message(22, payload)
-        await self._send(message)
-        return self._seq
+        return await self._send(message)
     
     async def send_events(self, events: List[Dict[str, Any]]) -> int:
         """Send events."""
         payload = {"events": events}
         message = self._create_message(5, payload)
-        await self._send(message)
-        return self._seq
+        return await self._send(message)
     async def send_auth_start(self, phone: str, language: str = "ru") -> int:
         """Start authentication."""
         payload = {
@@ -219,8 +304,7 @@ class MaxConnection(IConnection):
             "language": language
         }
         message = self._create_message(17, payload)
-        await self._send(message)
-        return self._seq
+        return await self._send(message)
     
     async def send_auth_code(self, token: str, verify_code: str) -> int:
         """Send auth code."""
@@ -230,8 +314,7 @@ class MaxConnection(IConnection):
             "authTokenType": "CHECK_CODE"
         }
         message = self._create_message(18, payload)
-        await self._send(message)
-        return self._seq
+        return await self._send(message)
     
     async def send_auth_token(self, token: str, interactive: bool = False, chats_count: int = DEFAULT_CHATS_COUNT) -> int:
         """Send auth token."""
@@ -239,73 +322,59 @@ class MaxConnection(IConnection):
             "interactive": interactive,
             "token": token,
             "chatsCount": chats_count,
-            "chatsSync": 0,
-            "contactsSync": 0,
-            "presenceSync": 0,
-            "draftsSync": 0
+            **_AUTH_TOKEN_SYNC
         }
         message = self._create_message(19, payload)
-        await self._send(message)
-        return self._seq
+        return await self._send(message)
     
     async def send_get_chats(self, chat_ids: List[int]) -> int:
         """Get chats."""
         payload = {"chatIds": chat_ids}
         message = self._create_message(48, payload)
-        await self._send(message)
-        return self._seq
+        return await self._send(message)
     
     async def send_get_contacts(self, contact_ids: List[int]) -> int:
         """Get contacts."""
         payload = {"contactIds": contact_ids}
         message = self._create_message(32, payload)
-        await self._send(message)
-        return self._seq
+        return await self._send(message)
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get connection headers."""
-        user_agent = self._session_data.get("user_agent", "")
-        return {
-            "Origin": "https://web.max.ru",
-            "User-Agent": user_agent,
-            "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
-            "Accept-Encoding": "gzip, deflate, br, zstd",
-            "Cache-Control": "no-cache",
-            "Pragma": "no-cache"
-        }
+    def _build_headers(self) -> Dict[str, str]:
+        """Build connection headers."""
+        return {**_STATIC_HEADERS, "User-Agent": self._session_data.get("user_agent", "")}
     
     def _create_message(self, opcode: int, payload: Dict[str, Any], cmd: int = 0) -> Dict[str, Any]:
         """Create protocol message."""
-        self._seq += 1
         return {
             "ver": self._session_data.get("version", 11),
             "cmd": cmd,
-            "seq": self._seq,
+            "seq": self._next_seq(),
             "opcode": opcode,
             "payload": payload
         }
     
-    async def _send(self, message: Dict[str, Any]) -> None:
-        """Send message through connection."""
-        data = json.dumps(message)
-        if self._debug:
-            print(Messages.DEBUG_SENDING.format(json.dumps(message, indent=2, ensure_ascii=False)))
+    async def _send(self, message: Dict[str, Any]) -> int:
+        """Send message through connection and return its seq."""
+        data = _encode_message(message)
+        logger.debug(Messages.DEBUG_SENDING, LazyJson(message))
         await self._connection.send(data)
+        seq: int = message["seq"]
+        return seq
     
     async def _initialize(self) -> None:
         """Initialize connection."""
-        print(Messages.DEVICE_INIT)
+        logger.info(Messages.DEVICE_INIT)
         init_payload = {
-            "userAgent": self._get_user_agent_dict(),
+            "userAgent": self._user_agent_dict,
             "deviceId": self._session_data.get("device_id", "")
         }
         message = self._create_message(6, init_payload)
         await self._send(message)
         device_id_short = self._session_data.get("device_id", "")[:8]
-        print(Messages.DEVICE_INIT_SENT.format(device_id_short))
+        logger.info(Messages.DEVICE_INIT_SENT, device_id_short)
     
-    def _get_user_agent_dict(self) -> Dict[str, Any]:
-        """Get user agent dictionary."""
+    def _build_user_agent_dict(self) -> Dict[str, Any]:
+        """Build user agent dictionary."""
         return {
             "deviceType": self._session_data.get("device_type", "ANDROID"),
             "locale": self._session_data.get("locale", "ru"),
@@ -320,60 +389,46 @@ class MaxConnection(IConnection):
     
     async def _listen(self) -> None:
         """Listen for incoming messages."""
-        while self.is_connected():
+        # receive() raises ConnectionError once the socket is closed, which ends the loop
+        while True:
             try:
-                data = await asyncio.wait_for(self._connection.receive(), timeout=1.0)
+                data = await self._connection.receive()
                 if data:
                     try:
-                        message = json.loads(data)
-                        if self._debug:
-                            print(Messages.DEBUG_RECEIVED.format(json.dumps(message, indent=2, ensure_ascii=False)))
+                        message = orjson.loads(data) if orjson else json.loads(data)
+                        logger.debug(Messages.DEBUG_RECEIVED, LazyJson(message))
                         await self._handle_message(message)
                     except json.JSONDecodeError:
-                        if self._debug:
-                            print(Messages.DEBUG_JSON_PARSE_FAILED.format(data))
+                        logger.debug(Messages.DEBUG_JSON_PARSE_FAILED, data)
                         continue
-            except asyncio.TimeoutError:
-                continue
             except ConnectionError:
-                print(Messages.WEBSOCKET_CLOSED)
+                logger.warning(Messages.WEBSOCKET_CLOSED)
                 break
             except Exception as err:
-                print(Messages.ERROR_RECEIVING.format(err))
+                logger.error(Messages.ERROR_RECEIVING, err)
                 continue
+        
+        # Skip deliberate closes, and listeners already replaced by a reconnect
+        if not self._closing and asyncio.current_task() is self._listen_task:
+            await self._call_handlers("closed", {})
     
     async def _handle_message(self, message: Dict[str, Any]) -> None:
         """Handle incoming message."""
         if not message or not isinstance(message, dict):
             return
         
-        opcode = message.get("opcode")
-        cmd = message.get("cmd")
-        payload = message.get("payload", {})
-        
-        event_name = None
+        event_name = _EVENT_TABLE.get((message.get("cmd"), message.get("opcode")))
+        if not event_name:
+            return
         
-        if cmd == 1:
-            if opcode == 19:
-                event_name = "auth_success"
-            elif opcode == 17:
-                event_name = "auth_code_requested"
-            elif opcode == 18:
-                event_name = "auth_code_checked"
-            elif opcode == 64:
-                event_name = "message_sent"
-            elif opcode == 32:
-                event_name = "contacts_update"
-            elif opcode == 48:
-                event_name = "chats_update"
-        elif cmd == 3:
-            if opcode == 19:
-                event_name = "auth_error"
-            elif opcode == 17:
-                event_name = "auth_code_error"
-        elif cmd == 0:
-            if opcode == 128:
-                event_name = "new_message"
+        await self._call_handlers(event_name, message.get("payload", {}))
+    
+    async def _call_handlers(self, event_name: str, payload: Dict[str, Any]) -> None:
+        """Run the handlers registered for an event, logging any that fail."""
+        # .get() so events without handlers don't create empty entries in the defaultdict
+        handlers = self._message_handlers.get(event_name)
+        if not handlers:
+            return
         
-        if event_name and event_name in self._message_handlers:
-            await call_handlers(self._message_handlers[event_name], payload)
\ No newline at end of file
+        for err in await call_handlers_concurrently(handlers, payload):
+            logger.error(Messages.ERROR_IN_HANDLER, event_name, err, exc_info=err)
\ No newline at end of file
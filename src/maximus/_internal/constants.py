@@ -1,15 +1,21 @@
 """Constants for the maximus library."""
 import asyncio
-from typing import Callable, Any, List
+from typing import Callable, Any, List, Sequence, Tuple
 
 # Connection constants
 WEBSOCKET_URL = "wss://ws-api.oneme.ru/websocket"
 DEFAULT_CHATS_COUNT = 40
-RECONNECT_DELAY = 2
+CONTACTS_BATCH_SIZE = 50
 AUTH_DELAY = 0.5
-SYNC_DELAY = 5
 AUTH_TIMEOUT = 60.0
 
+# Reconnect backoff: the first retry waits a random fraction of BACKOFF_INITIAL,
+# later ones start at BACKOFF_MIN and grow by BACKOFF_FACTOR up to BACKOFF_MAX
+BACKOFF_INITIAL = 5
+BACKOFF_MIN = 1.92
+BACKOFF_FACTOR = 1.618
+BACKOFF_MAX = 60.0
+
 # Default session values
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -59,29 +65,63 @@ class Messages:
     DEVICE_INIT = "🔧 Инициализация устройства..."
     
     # Error messages
-    ERROR_RECEIVING = "⚠️ Ошибка при получении сообщения: {}"
-    ERROR_RECONNECTING = "Error reconnecting: {}"
-    ERROR_SYNCING = "Error syncing: {}"
-    ERROR_SAVING_SESSION = "Error saving session: {}"
-    AUTH_ERROR = "❌ Authorization error: {}"
-    AUTH_CODE_ERROR = "❌ Authorization code error: {}"
+    ERROR_RECEIVING = "⚠️ Ошибка при получении сообщения: %s"
+    ERROR_RECONNECTING = "Error reconnecting: %s"
+    ERROR_SYNCING = "Error syncing: %s"
+    ERROR_SAVING_SESSION = "Error saving session: %s"
+    ERROR_IN_HANDLER = "Error in %s handler: %s"
+    AUTH_ERROR = "❌ Authorization error: %s"
+    AUTH_CODE_ERROR = "❌ Authorization code error: %s"
     
     # Debug messages
-    DEBUG_SENDING = "[DEBUG] Sending: {}"
-    DEBUG_RECEIVED = "[DEBUG] Received: {}"
-    DEBUG_JSON_PARSE_FAILED = "[DEBUG] Failed to parse JSON: {}"
+    DEBUG_SENDING = "[DEBUG] Sending: %s"
+    DEBUG_RECEIVED = "[DEBUG] Received: %s"
+    DEBUG_JSON_PARSE_FAILED = "[DEBUG] Failed to parse JSON: %s"
     
     # Other messages
-    DEVICE_INIT_SENT = "📤 Отправлена инициализация (Device ID: {}...)"
-    PHONE_SENDING = "Sending phone number: {}"
-    USER_INFO = "👤 Пользователь: {} (ID: {})"
-    CHATS_LOADED = "💬 Загружено чатов: {}"
+    DEVICE_INIT_SENT = "📤 Отправлена инициализация (Device ID: %s...)"
+    PHONE_SENDING = "Sending phone number: %s"
+    USER_INFO = "👤 Пользователь: %s (ID: %s)"
+    CHATS_LOADED = "💬 Загружено чатов: %s"
+
+
+# (is_coroutine, is_sequential, handler), classified once when the handler is registered
+HandlerEntry = Tuple[bool, bool, Callable[..., Any]]
 
 
-async def call_handlers(handlers: List[Callable], *args, **kwargs) -> None:
-    """Utility function to call handlers (sync or async)."""
-    for handler in handlers:
-        if asyncio.iscoroutinefunction(handler):
-            await handler(*args, **kwargs)
-        else:
-            handler(*args, **kwargs)
\ No newline at end of file
+def classify_handler(handler: Callable[..., Any]) -> HandlerEntry:
+    """Classify a handler for call_handlers_concurrently."""
+    # Coroutine handlers that set `_sequential = True` are awaited in order instead of overlapping
+    is_coro = asyncio.iscoroutinefunction(handler)
+    return (is_coro, is_coro and bool(getattr(handler, "_sequential", False)), handler)
+
+
+async def call_handlers_concurrently(
+    handlers: Sequence[HandlerEntry], *args: Any, **kwargs: Any
+) -> List[Exception]:
+    """Utility function to call handlers, running async ones concurrently."""
+    # Sync and sequential handlers run inline in registration order, the rest overlap.
+    # A failing handler never stops or cancels the others; its exception is returned.
+    errors: List[Exception] = []
+    coros = []
+    for is_coro, is_sequential, handler in handlers:
+        try:
+            if not is_coro:
+                handler(*args, **kwargs)
+            elif is_sequential:
+                await handler(*args, **kwargs)
+            else:
+                coros.append(handler(*args, **kwargs))
+        except Exception as err:
+            errors.append(err)
+    
+    if len(coros) == 1:
+        try:
+            await coros[0]
+        except Exception as err:
+            errors.append(err)
+    elif coros:
+        # return_exceptions keeps one failing handler from cancelling the rest
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        errors.extend(result for result in results if isinstance(result, Exception))
+    return errors
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from ..types import Chat, User, Message, ChatType
 from .interfaces import IDataMapper
 
@@ -11,6 +11,8 @@ class DataManager:
         self._chats: Dict[int, Chat] = {}
         self._users: Dict[int, User] = {}
         self._user: Optional[User] = None
+        # participant id -> ids of chats they are in, kept in sync by update_chats
+        self._participant_index: Dict[int, Set[int]] = {}
     
     @property
     def user(self) -> Optional[User]:
@@ -28,11 +30,11 @@ class DataManager:
     
     def get_chat(self, chat_id: int) -> Optional[Chat]:
         """Get specific chat."""
-        chat = self._chats.get(chat_id)
-        if chat and not hasattr(chat, '_client'):
-            # Will be set by client
-            pass
-        return chat
+        return self._chats.get(chat_id)
+    
+    def get_participant_ids(self) -> Set[int]:
+        """Get ids of everyone participating in any known chat."""
+        return set(self._participant_index)
     
     def get_user(self, user_id: int) -> Optional[User]:
         """Get user by ID."""
@@ -46,29 +48,37 @@ class DataManager:
         """Iterate over users."""
         return iter(self._users.values())
     
-    def set_current_user(self, user_data: Dict[str, Any]) -> None:
+    def set_current_user(self, user_data: Dict[str, Any], client: Optional[Any] = None) -> None:
         """Set current user from data."""
-        self._user = self._mapper.user_from_dict(user_data)
+        self._user = self._mapper.user_from_dict(user_data, client=client)
     
     def update_chats(self, chats_data: List[Dict[str, Any]], client: Optional[Any] = None) -> None:
         """Update chats from data."""
+        users = self._users
+        my_id = self._user.id if self._user else None
         for chat_data in chats_data:
             chat = self._mapper.chat_from_dict(chat_data, client=client)
+            previous = self._chats.get(chat.id)
+            if previous:
+                self._unindex_participants(previous)
             self._chats[chat.id] = chat
+            for pid in chat.participants:
+                self._participant_index.setdefault(pid, set()).add(chat.id)
             
-            if chat.type == ChatType.DIALOG and not chat.title:
-                participant_ids = list(chat.participants.keys())
-                for pid in participant_ids:
-                    user = self.get_user(pid)
+            if chat.type == ChatType.DIALOG and not chat.title and users:
+                for pid in chat.participants:
+                    if pid == my_id:
+                        continue
+                    user = users.get(pid)
                     if user and user.name:
-                        object.__setattr__(chat, 'title', user.name)
+                        chat.title = user.name
                         break
     
-    def update_users(self, users_data: List[Dict[str, Any]]) -> List[User]:
+    def update_users(self, users_data: List[Dict[str, Any]], client: Optional[Any] = None) -> List[User]:
         """Update users from data."""
         users = []
         for user_data in users_data:
-            user = self._mapper.user_from_dict(user_data)
+            user = self._mapper.user_from_dict(user_data, client=client)
             self._users[user.id] = user
             users.append(user)
             
@@ -76,10 +86,25 @@ class DataManager:
             if user.id in self._chats:
                 chat = self._chats[user.id]
                 if not chat.title and user.name:
-                    object.__setattr__(chat, 'title', user.name)
+                    chat.title = user.name
+            
+            if user.name and not (self._user and user.id == self._user.id):
+                for chat_id in self._participant_index.get(user.id, ()):
+                    chat = self._chats[chat_id]
+                    if chat.type == ChatType.DIALOG and not chat.title:
+                        chat.title = user.name
         
         return users
     
+    def _unindex_participants(self, chat: Chat) -> None:
+        """Drop a chat from the participant index."""
+        for pid in chat.participants:
+            chat_ids = self._participant_index.get(pid)
+            if chat_ids is not None:
+                chat_ids.discard(chat.id)
+                if not chat_ids:
+                    del self._participant_index[pid]
+    
     def create_message(self, message_data: Dict[str, Any], chat_id: int, client: Optional[Any] = None) -> Message:
         """Create message from data."""
         return self._mapper.message_from_dict(message_data, chat_id, client)
\ No newline at end of file
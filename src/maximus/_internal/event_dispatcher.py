@@ -1,14 +1,18 @@
-import asyncio
-from typing import Callable, List, Dict, Any
+import logging
+from typing import Any, Callable, Dict, Tuple
 from .interfaces import IEventDispatcher
-from .constants import call_handlers
+from .constants import Messages, HandlerEntry, call_handlers_concurrently, classify_handler
+
+logger = logging.getLogger("maximus.events")
 
 
 class EventDispatcher(IEventDispatcher):
     """Event dispatcher implementation."""
     
     def __init__(self) -> None:
-        self._event_handlers: Dict[str, List[Callable]] = {}
+        # Handlers are stored classified so dispatch doesn't re-inspect them.
+        # Tuples are replaced rather than mutated, so handlers may (un)register mid-dispatch.
+        self._event_handlers: Dict[str, Tuple[HandlerEntry, ...]] = {}
     
     def on(self, event_type: str) -> Callable:
         """Decorator for event handlers."""
@@ -19,17 +23,22 @@ class EventDispatcher(IEventDispatcher):
     
     def add_event_handler(self, event_name: str, handler: Callable) -> None:
         """Add event handler."""
-        if event_name not in self._event_handlers:
-            self._event_handlers[event_name] = []
-        self._event_handlers[event_name].append(handler)
+        entry = classify_handler(handler)
+        self._event_handlers[event_name] = self._event_handlers.get(event_name, ()) + (entry,)
     
     def remove_event_handler(self, event_name: str, handler: Callable) -> None:
         """Remove event handler."""
-        if event_name in self._event_handlers:
-            if handler in self._event_handlers[event_name]:
-                self._event_handlers[event_name].remove(handler)
+        handlers = self._event_handlers.get(event_name, ())
+        for index, (_, _, registered) in enumerate(handlers):
+            if registered == handler:
+                self._event_handlers[event_name] = handlers[:index] + handlers[index + 1:]
+                break
     
-    async def dispatch_event(self, event_name: str, *args, **kwargs) -> None:
+    async def dispatch_event(self, event_name: str, *args: Any, **kwargs: Any) -> None:
         """Dispatch event to handlers."""
-        if event_name in self._event_handlers:
-            await call_handlers(self._event_handlers[event_name], *args, **kwargs)
\ No newline at end of file
+        handlers = self._event_handlers.get(event_name)
+        if not handlers:
+            return
+        
+        for err in await call_handlers_concurrently(handlers, *args, **kwargs):
+            logger.error(Messages.ERROR_IN_HANDLER, event_name, err, exc_info=err)
\ No newline at end of file
@@ -139,7 +139,7 @@ class IDataMapper(ABC):
     """Interface for data mapping."""
     
     @abstractmethod
-    def user_from_dict(self, data: Dict[str, Any]) -> "User":
+    def user_from_dict(self, data: Dict[str, Any], client: Optional[Any] = None) -> "User":
         """Map dict to User."""
         pass
     
@@ -1,74 +1,96 @@
-from typing import Dict, Any, Optional, TYPE_CHECKING
+import sys
+from typing import Dict, Any, FrozenSet, Optional, Tuple, TYPE_CHECKING
 from ..types import User, Chat, Message, ChatType
 from .interfaces import IDataMapper
 
 if TYPE_CHECKING:
     from maximus.client import MaxClient
 
+# Fallback for contacts without a names list
+_NO_NAMES: Tuple[Dict[str, Any]] = ({},)
+# Shared by every message without attachments
+_EMPTY: Tuple[Dict[str, Any], ...] = ()
+_NO_PARTICIPANTS: FrozenSet[int] = frozenset()
+# Enum-like strings (message type, chat status) repeat on every event, so keep one copy each
+_INTERNED: Dict[str, str] = {}
+
+
+def _intern(value: str) -> str:
+    """Return the canonical copy of a repeated short string."""
+    interned = _INTERNED.get(value)
+    if interned is None:
+        interned = _INTERNED[value] = sys.intern(value)
+    return interned
+
 
 class DataMapper(IDataMapper):
     """Data mapper implementation."""
     
-    def user_from_dict(self, data: Dict[str, Any]) -> User:
+    def user_from_dict(self, data: Dict[str, Any], client: Optional["MaxClient"] = None) -> User:
         """Map dict to User."""
-        if "contact" in data:
-            contact = data.get("contact", {})
-            names = contact.get("names", [{}])
-            name_data = names[0] if names else {}
-            return User(
-                id=contact.get("id", 0),
-                phone=contact.get("phone"),
-                name=name_data.get("name"),
-                first_name=name_data.get("firstName"),
-                last_name=name_data.get("lastName")
-            )
-        else:
-            names = data.get("names", [{}])
-            name_data = names[0] if names else {}
-            return User(
-                id=data.get("id", 0),
-                phone=data.get("phone"),
-                name=name_data.get("name"),
-                first_name=name_data.get("firstName"),
-                last_name=name_data.get("lastName"),
-                photo_id=data.get("photoId"),
-                base_url=data.get("baseUrl")
+        # Bound .get methods are hoisted into locals: this runs for every contact at login
+        get = data.get
+        contact = get("contact")
+        if contact is not None:
+            contact_get = contact.get
+            name_get = (contact_get("names") or _NO_NAMES)[0].get
+            return User._from_raw(
+                contact_get("id", 0),
+                contact_get("phone"),
+                name_get("name"),
+                name_get("firstName"),
+                name_get("lastName"),
+                None,
+                None,
+                client
             )
+        
+        name_get = (get("names") or _NO_NAMES)[0].get
+        return User._from_raw(
+            get("id", 0),
+            get("phone"),
+            name_get("name"),
+            name_get("firstName"),
+            name_get("lastName"),
+            get("photoId"),
+            get("baseUrl"),
+            client
+        )
     
     def message_from_dict(self, data: Dict[str, Any], chat_id: int, client: Optional["MaxClient"] = None) -> Message:
         """Map dict to Message."""
-        message = Message(
-            id=data.get("id", ""),
-            text=data.get("text", ""),
-            sender=data.get("sender", 0),
-            time=data.get("time", 0),
-            chat_id=chat_id,
-            type=data.get("type", "USER"),
-            attaches=data.get("attaches", [])
+        get = data.get
+        return Message._from_raw(
+            get("id", ""),
+            get("text", ""),
+            get("sender", 0),
+            get("time", 0),
+            chat_id,
+            _intern(get("type") or "USER"),
+            get("attaches") or _EMPTY,
+            client
         )
-        if client:
-            object.__setattr__(message, '_client', client)
-        return message
     
     def chat_from_dict(self, data: Dict[str, Any], client: Optional["MaxClient"] = None) -> Chat:
         """Map dict to Chat."""
-        chat_type = ChatType(data.get("type", "DIALOG"))
-        last_msg_data = data.get("lastMessage")
+        get = data.get
+        chat_id = get("id", 0)
+        participants = get("participants")
+        last_msg_data = get("lastMessage")
         last_message = None
         if last_msg_data:
-            last_message = self.message_from_dict(last_msg_data, data.get("id", 0), client)
+            last_message = self.message_from_dict(last_msg_data, chat_id, client)
         
-        chat = Chat(
-            id=data.get("id", 0),
-            type=chat_type,
-            title=data.get("title"),
-            participants=data.get("participants", {}),
-            last_message=last_message,
-            owner=data.get("owner"),
-            created=data.get("created"),
-            modified=data.get("modified"),
-            status=data.get("status", "ACTIVE")
-        )
-        if client:
-            object.__setattr__(chat, '_client', client)
-        return chat
\ No newline at end of file
+        return Chat._from_raw(
+            chat_id,
+            ChatType(get("type", "DIALOG")),
+            get("title"),
+            # Only the ids are used; JSON object keys arrive as strings
+            frozenset(map(int, participants)) if participants else _NO_PARTICIPANTS,
+            last_message,
+            get("owner"),
+            get("created"),
+            get("modified"),
+            _intern(get("status") or "ACTIVE"),
+            client
+        )
\ No newline at end of file
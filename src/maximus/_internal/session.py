@@ -1,7 +1,15 @@
+import asyncio
 import json
+import logging
 import os
 from typing import Dict, Any, Optional
 from uuid import uuid4
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .interfaces import ISessionManager
 from .constants import (
     DEFAULT_USER_AGENT, DEFAULT_APP_VERSION, DEFAULT_DEVICE_TYPE,
@@ -9,6 +17,8 @@ from .constants import (
     DEFAULT_SCREEN, DEFAULT_TIMEZONE, DEFAULT_VERSION, Messages
 )
 
+logger = logging.getLogger("maximus.session")
+
 
 class SessionManager(ISessionManager):
     """Session manager implementation."""
@@ -16,6 +26,7 @@ class SessionManager(ISessionManager):
     def __init__(self, session_file: Optional[str] = None) -> None:
         self._session_file = session_file or "session.maximus"
         self._data: Dict[str, Any] = self._get_defaults()
+        self._save_lock = asyncio.Lock()
     
     def _get_defaults(self) -> Dict[str, Any]:
         """Get default session values."""
@@ -37,29 +48,49 @@ class SessionManager(ISessionManager):
     
     async def load(self) -> None:
         """Load session data from file."""
-        if not os.path.exists(self._session_file):
-            return
-        
-        try:
-            with open(self._session_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                for key, value in data.items():
-                    self._data[key] = value
-        except (json.JSONDecodeError, FileNotFoundError, PermissionError):
-            pass
+        data = await asyncio.to_thread(self._load_sync, self._session_file)
+        if data:
+            self._data.update(data)
     
     async def save(self) -> None:
         """Save session data to file."""
+        # Snapshot so the worker thread never sees later set() calls; the lock keeps
+        # overlapping saves from racing on the temporary file
+        async with self._save_lock:
+            try:
+                await asyncio.to_thread(self._save_sync, self._session_file, dict(self._data))
+            except (PermissionError, OSError) as e:
+                logger.error(Messages.ERROR_SAVING_SESSION, e)
+    
+    @staticmethod
+    def _load_sync(session_file: str) -> Optional[Dict[str, Any]]:
+        """Read session file (runs in a worker thread)."""
+        # FileNotFoundError means no saved session
         try:
-            # Create directory if it doesn't exist
-            dir_path = os.path.dirname(self._session_file)
-            if dir_path:
-                os.makedirs(dir_path, exist_ok=True)
-            
-            with open(self._session_file, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=2, ensure_ascii=False)
-        except (PermissionError, OSError) as e:
-            print(Messages.ERROR_SAVING_SESSION.format(e))
+            with open(session_file, "rb") as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson else json.loads(raw)
+        except (json.JSONDecodeError, FileNotFoundError, PermissionError):
+            return None
+    
+    @staticmethod
+    def _save_sync(session_file: str, data: Dict[str, Any]) -> None:
+        """Write session file (runs in a worker thread)."""
+        # Create directory if it doesn't exist
+        dir_path = os.path.dirname(session_file)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        
+        if orjson:
+            raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            raw = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        
+        # Write next to the target and swap it in, so a crash never leaves a half-written session
+        tmp_file = f"{session_file}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(raw)
+        os.replace(tmp_file, session_file)
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get session value."""
@@ -1,4 +1,6 @@
 import asyncio
+import logging
+import random
 from typing import Optional, Callable, Dict, Any, List
 
 from .types import Chat, User, Message
@@ -11,9 +13,12 @@ from ._internal.data_manager import DataManager
 from ._internal.constants import (
     DEFAULT_DEVICE_TYPE, DEFAULT_LOCALE, DEFAULT_OS_VERSION,
     DEFAULT_DEVICE_NAME, DEFAULT_SCREEN, DEFAULT_TIMEZONE, DEFAULT_VERSION,
-    RECONNECT_DELAY, AUTH_DELAY, SYNC_DELAY, DEFAULT_CHATS_COUNT, Messages
+    AUTH_DELAY, DEFAULT_CHATS_COUNT, CONTACTS_BATCH_SIZE, BACKOFF_INITIAL,
+    BACKOFF_MIN, BACKOFF_FACTOR, BACKOFF_MAX, Messages
 )
 
+logger = logging.getLogger("maximus.client")
+
 
 class MaxClient:
     """MAX messenger client with clean OOP architecture."""
@@ -45,6 +50,12 @@ class MaxClient:
         self._auth_manager: Optional[AuthManager] = None
         
         self._debug = debug
+        # Next reconnect delay; None means the next attempt is the first of an outage
+        self._backoff: Optional[float] = None
+        # Set by the connection's "closed" event, awaited by run_until_disconnected()
+        self._disconnected = asyncio.Event()
+        # Set by disconnect() so run_until_disconnected() returns instead of reconnecting
+        self._stopping = False
         
         # Configure session
         self._configure_session(
@@ -94,6 +105,7 @@ class MaxClient:
         self._connection.register_event_handler("contacts_update", self._on_contacts_update)
         self._connection.register_event_handler("chats_update", self._on_chats_update)
         self._connection.register_event_handler("message_sent", self._on_message_sent)
+        self._connection.register_event_handler("closed", self._on_connection_closed)
     
     async def start(
         self,
@@ -101,6 +113,7 @@ class MaxClient:
         code_callback: Optional[Callable] = None
     ) -> None:
         """Start client and authenticate."""
+        self._stopping = False
         await self._session.load()
         
         # Initialize connection and auth manager
@@ -110,9 +123,9 @@ class MaxClient:
         
         self._setup_event_handlers()
         
-        print(Messages.CONNECTING_WEBSOCKET)
+        logger.info(Messages.CONNECTING_WEBSOCKET)
         await self._connection.connect()
-        print(Messages.CONNECTED_WEBSOCKET)
+        logger.info(Messages.CONNECTED_WEBSOCKET)
         
         # Authenticate
         await self._auth_manager.authenticate(phone, code_callback)
@@ -124,8 +137,10 @@ class MaxClient:
     
     async def disconnect(self) -> None:
         """Disconnect from API."""
+        self._stopping = True
         if self._connection:
             await self._connection.disconnect()
+        self._disconnected.set()
     
     # Event system - direct delegation to EventDispatcher
     def on(self, event_type: str) -> Callable:
@@ -144,7 +159,7 @@ class MaxClient:
     async def _ensure_connected(self) -> None:
         """Ensure connection is active."""
         if not self._connection or not self._connection.is_connected():
-            print(Messages.CONNECTION_LOST)
+            logger.warning(Messages.CONNECTION_LOST)
             await self._reconnect()
     
     async def send_message(self, chat_id: int, text: str, reply_to: Optional[str] = None) -> Optional[Message]:
@@ -184,10 +199,7 @@ class MaxClient:
     
     def get_chat(self, chat_id: int) -> Optional[Chat]:
         """Get specific chat."""
-        chat = self._data_manager.get_chat(chat_id)
-        if chat and not hasattr(chat, '_client'):
-            object.__setattr__(chat, '_client', self)
-        return chat
+        return self._data_manager.get_chat(chat_id)
     
     def get_user(self, user_id: int) -> Optional[User]:
         """Get user by ID."""
@@ -216,33 +228,43 @@ class MaxClient:
         return self._data_manager.chats
     
     async def run_until_disconnected(self) -> None:
-        """Keep running until interrupted."""
+        """Keep running until interrupted or disconnect() is called."""
         try:
-            while True:
+            while not self._stopping:
                 if not self._connection or not self._connection.is_connected():
                     await self._reconnect()
-                await asyncio.sleep(1)
+                    continue
+                # Drop closures that were already handled by _ensure_connected()
+                self._disconnected.clear()
+                await self._disconnected.wait()
         except KeyboardInterrupt:
             await self.disconnect()
     
     async def _reconnect(self) -> None:
         """Reconnect to the service."""
+        if self._backoff is None:
+            delay = random.random() * BACKOFF_INITIAL
+            self._backoff = BACKOFF_MIN
+        else:
+            delay = self._backoff
+            self._backoff = min(self._backoff * BACKOFF_FACTOR, BACKOFF_MAX)
+        
         try:
-            await asyncio.sleep(RECONNECT_DELAY)
-            print(Messages.RECONNECTING_WEBSOCKET)
+            await asyncio.sleep(delay)
+            logger.info(Messages.RECONNECTING_WEBSOCKET)
             if self._connection:
                 await self._connection.connect()
             token = self._session.get("token")
             if token and self._connection:
                 await asyncio.sleep(AUTH_DELAY)
-                print(Messages.AUTH_BY_TOKEN)
+                logger.info(Messages.AUTH_BY_TOKEN)
                 await self._connection.send_auth_token(token, interactive=False, chats_count=DEFAULT_CHATS_COUNT)
-                print(Messages.RECONNECT_COMPLETED)
+                logger.info(Messages.RECONNECT_COMPLETED)
             else:
-                print(Messages.TOKEN_NOT_FOUND)
+                logger.warning(Messages.TOKEN_NOT_FOUND)
+            self._backoff = None
         except Exception as e:
-            print(Messages.ERROR_RECONNECTING.format(e))
-            await asyncio.sleep(SYNC_DELAY)
+            logger.error(Messages.ERROR_RECONNECTING, e)
     
     async def _sync_after_auth(self) -> None:
         """Sync data after authentication."""
@@ -250,16 +272,19 @@ class MaxClient:
             if 0 in self._data_manager.chats and self._connection:
                 await self._connection.send_get_chats([0])
             
-            contact_ids = set()
+            contact_ids = self._data_manager.get_participant_ids()
             if self._data_manager.user:
                 contact_ids.add(self._data_manager.user.id)
-            for chat in self._data_manager.chats.values():
-                contact_ids.update(chat.participants.keys())
             
             if contact_ids and self._connection:
-                await self._connection.send_get_contacts(list(contact_ids)[:50])
+                # The server caps each request, so fetch everyone in batches written back to back
+                ids = list(contact_ids)
+                await asyncio.gather(*(
+                    self._connection.send_get_contacts(ids[i:i + CONTACTS_BATCH_SIZE])
+                    for i in range(0, len(ids), CONTACTS_BATCH_SIZE)
+                ))
         except Exception as err:
-            print(Messages.ERROR_SYNCING.format(err))
+            logger.error(Messages.ERROR_SYNCING, err)
     
     # Event handlers
     async def _on_auth_success(self, payload: Dict[str, Any]) -> None:
@@ -267,12 +292,12 @@ class MaxClient:
         profile = payload.get("profile", {})
         contact = profile.get("contact", {})
         if contact:
-            self._data_manager.set_current_user({"contact": contact})
+            self._data_manager.set_current_user({"contact": contact}, client=self)
             user_name = self._data_manager.user.name or f"User {self._data_manager.user.id}"
-            print(Messages.USER_INFO.format(user_name, self._data_manager.user.id))
+            logger.info(Messages.USER_INFO, user_name, self._data_manager.user.id)
         
         chats_data = payload.get("chats", [])
-        print(Messages.CHATS_LOADED.format(len(chats_data)))
+        logger.info(Messages.CHATS_LOADED, len(chats_data))
         self._data_manager.update_chats(chats_data, client=self)
         
         await self._event_dispatcher.dispatch_event("ready")
@@ -289,7 +314,7 @@ class MaxClient:
     async def _on_contacts_update(self, payload: Dict[str, Any]) -> None:
         """Handle contacts update."""
         contacts = payload.get("contacts", [])
-        users = self._data_manager.update_users(contacts)
+        users = self._data_manager.update_users(contacts, client=self)
         await self._event_dispatcher.dispatch_event("contacts_update", users)
     
     async def _on_chats_update(self, payload: Dict[str, Any]) -> None:
@@ -297,6 +322,10 @@ class MaxClient:
         chats_data = payload.get("chats", [])
         self._data_manager.update_chats(chats_data, client=self)
     
+    def _on_connection_closed(self, payload: Dict[str, Any]) -> None:
+        """Handle connection closed."""
+        self._disconnected.set()
+    
     async def _on_message_sent(self, payload: Dict[str, Any]) -> None:
         """Handle message sent."""
         message_data = payload.get("message", {})
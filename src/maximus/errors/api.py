@@ -1,31 +1,51 @@
+from typing import Any, Dict, Optional, Type
+
 from .base import MaximusError
 
+# status code -> error class, filled in by MaxApiError.__init_subclass__
+_ERRORS: Dict[int, Type["MaxApiError"]] = {}
+
 
 class MaxApiError(MaximusError):
     """Base API error."""
-    pass
+    status_code: Optional[int] = None
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "status_code" in cls.__dict__ and cls.status_code is not None:
+            _ERRORS[cls.status_code] = cls
+    
+    def __init__(self, message: str = "", status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        if status_code is not None:
+            self.status_code = status_code
+    
+    @classmethod
+    def from_status(cls, status_code: int, message: str = "") -> "MaxApiError":
+        """Create the error matching a status code."""
+        return _ERRORS.get(status_code, MaxApiError)(message, status_code)
 
 
 class MaxBadRequestError(MaxApiError):
     """400 Bad Request."""
-    pass
+    status_code = 400
 
 
 class MaxUnauthorizedError(MaxApiError):
     """401 Unauthorized."""
-    pass
+    status_code = 401
 
 
 class MaxNotFoundError(MaxApiError):
     """404 Not Found."""
-    pass
+    status_code = 404
 
 
 class MaxTooManyRequestsError(MaxApiError):
     """429 Too Many Requests."""
-    pass
+    status_code = 429
 
 
 class MaxServiceUnavailableError(MaxApiError):
     """503 Service Unavailable."""
-    pass
\ No newline at end of file
+    status_code = 503
@@ -1,6 +1,9 @@
-from typing import Optional, Dict, TYPE_CHECKING
+from __future__ import annotations
 
-from ..base import MaximusType
+from dataclasses import field
+from typing import Optional, FrozenSet, TYPE_CHECKING
+
+from ..base import MaximusType, _chat_fallback_name
 from ..enums.chat_type import ChatType
 
 if TYPE_CHECKING:
@@ -9,54 +12,50 @@ if TYPE_CHECKING:
     from maximus.client import MaxClient
 
 
-class Chat(MaximusType):
+class Chat(MaximusType, frozen=False):
     id: int
     type: ChatType
     title: Optional[str] = None
-    participants: Dict[int, int] = None
-    last_message: Optional["Message"] = None
+    participants: FrozenSet[int] = frozenset()
+    last_message: Optional[Message] = None
     owner: Optional[int] = None
     created: Optional[int] = None
     modified: Optional[int] = None
     status: str = "ACTIVE"
-    
-    def __post_init__(self) -> None:
-        if self.participants is None:
-            object.__setattr__(self, 'participants', {})
+    _client: Optional[MaxClient] = field(default=None, init=False, repr=False, compare=False)
+    # Dialog name resolved from a participant; a title set later still takes precedence
+    _display_name_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def display_name(self) -> str:
         if self.title:
             return self.title
+        if self._display_name_cache is not None:
+            return self._display_name_cache
         if self.type == ChatType.DIALOG and self.participants:
-            participant_ids = list(self.participants.keys())
-            if participant_ids and hasattr(self, '_client') and self._client:
-                user = self._client.get_user(participant_ids[0])
-                if user and user.name:
-                    return user.name
-        return f"Chat {self.id}"
+            client = self._client
+            if client:
+                me = client.user
+                for pid in self.participants:
+                    if me and pid == me.id:
+                        continue
+                    user = client.get_user(pid)
+                    if user and user.name:
+                        self._display_name_cache = user.name
+                        return user.name
+        return _chat_fallback_name(self.id)
     
-    async def send_message(self, text: str) -> Optional["Message"]:
-        if hasattr(self, '_client') and self._client:
-            return await self._client.send_message(self.id, text)
-        raise RuntimeError("Chat not bound to client")
+    async def send_message(self, text: str) -> Optional[Message]:
+        return await self._require_client().send_message(self.id, text)
     
-    async def send_sticker(self, sticker_id: int) -> Optional["Message"]:
-        if hasattr(self, '_client') and self._client:
-            return await self._client.send_sticker(self.id, sticker_id)
-        raise RuntimeError("Chat not bound to client")
+    async def send_sticker(self, sticker_id: int) -> Optional[Message]:
+        return await self._require_client().send_sticker(self.id, sticker_id)
     
-    async def reply(self, message: "Message", text: str) -> Optional["Message"]:
-        if hasattr(self, '_client') and self._client:
-            return await self._client.send_message(self.id, text, reply_to=message.id)
-        raise RuntimeError("Chat not bound to client")
+    async def reply(self, message: Message, text: str) -> Optional[Message]:
+        return await self._require_client().send_message(self.id, text, reply_to=message.id)
     
-    async def reply_sticker(self, message: "Message", sticker_id: int) -> Optional["Message"]:
-        if hasattr(self, '_client') and self._client:
-            return await self._client.send_sticker(self.id, sticker_id, reply_to=message.id)
-        raise RuntimeError("Chat not bound to client")
+    async def reply_sticker(self, message: Message, sticker_id: int) -> Optional[Message]:
+        return await self._require_client().send_sticker(self.id, sticker_id, reply_to=message.id)
     
     async def react_to_message(self, message_id: str, reaction: str = "👍") -> None:
-        if hasattr(self, '_client') and self._client:
-            return await self._client.send_reaction(self.id, message_id, reaction)
-        raise RuntimeError("Chat not bound to client")
\ No newline at end of file
+        return await self._require_client().send_reaction(self.id, message_id, reaction)
\ No newline at end of file
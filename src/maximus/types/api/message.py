@@ -1,6 +1,10 @@
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from __future__ import annotations
 
-from ..base import MaximusType
+import weakref
+from dataclasses import field
+from typing import Optional, Dict, Any, Iterable, Sequence, TYPE_CHECKING
+
+from ..base import MaximusType, _user_fallback_name
 
 if TYPE_CHECKING:
     from maximus.types.api.chat import Chat
@@ -8,61 +12,106 @@ if TYPE_CHECKING:
     from maximus.client import MaxClient
 
 
-class Message(MaximusType):
+class Message(MaximusType, frozen=False):
     id: str
     text: str
     sender: int
     time: int
     chat_id: int
     type: str = "USER"
-    attaches: List[Dict[str, Any]] = None
+    attaches: Sequence[Dict[str, Any]] = ()
+    _client: Optional[MaxClient] = field(default=None, init=False, repr=False, compare=False)
+    # Weak references to the resolved chat/sender, so repeated property access skips the client
+    _chat_cache: Optional[weakref.ref[Chat]] = field(default=None, init=False, repr=False, compare=False)
+    _sender_cache: Optional[weakref.ref[User]] = field(default=None, init=False, repr=False, compare=False)
+    # Names are cached once resolved; fallbacks aren't, so contacts loaded later still show up
+    _sender_name_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _chat_title_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
-    def __post_init__(self) -> None:
-        if self.attaches is None:
-            object.__setattr__(self, 'attaches', [])
+    @classmethod
+    def prefetch(cls, messages: Iterable[Message], client: Optional[MaxClient] = None) -> None:
+        """Resolve chats and senders for a batch of messages, once per distinct id."""
+        messages = list(messages)
+        if client is None:
+            client = next((m._client for m in messages if m._client), None)
+            if client is None:
+                return
+        
+        users = {uid: client.get_user(uid) for uid in {m.sender for m in messages}}
+        chats = {cid: client.get_chat(cid) for cid in {m.chat_id for m in messages}}
+        for message in messages:
+            sender = users[message.sender]
+            if sender is not None:
+                message._sender_cache = weakref.ref(sender)
+                if sender.name:
+                    message._sender_name_cache = sender.name
+            chat = chats[message.chat_id]
+            if chat is not None:
+                message._chat_cache = weakref.ref(chat)
+                if chat.title:
+                    message._chat_title_cache = chat.title
     
     @property
-    def chat(self) -> Optional["Chat"]:
-        if hasattr(self, '_client') and self._client:
-            return self._client.get_chat(self.chat_id)
-        return None
+    def chat(self) -> Optional[Chat]:
+        ref = self._chat_cache
+        chat = ref() if ref else None
+        if chat is None:
+            client = self._client
+            if not client:
+                return None
+            chat = client.get_chat(self.chat_id)
+            if chat is not None:
+                self._chat_cache = weakref.ref(chat)
+        return chat
     
     @property
-    def sender_user(self) -> Optional["User"]:
-        if hasattr(self, '_client') and self._client:
-            return self._client.get_user(self.sender)
-        return None
+    def sender_user(self) -> Optional[User]:
+        ref = self._sender_cache
+        sender = ref() if ref else None
+        if sender is None:
+            client = self._client
+            if not client:
+                return None
+            sender = client.get_user(self.sender)
+            if sender is not None:
+                self._sender_cache = weakref.ref(sender)
+        return sender
     
+    # sender_name and chat_title look up the client directly rather than going through the
+    # chat/sender_user properties; once a name resolves it is served from its own cache
     @property
     def sender_name(self) -> str:
-        sender = self.sender_user
-        if sender and sender.name:
-            return sender.name
-        return f"User {self.sender}"
+        name = self._sender_name_cache
+        if name is None:
+            client = self._client
+            sender = client.get_user(self.sender) if client else None
+            if not (sender and sender.name):
+                return _user_fallback_name(self.sender)
+            name = self._sender_name_cache = sender.name
+        return name
     
     @property
     def chat_title(self) -> str:
-        chat = self.chat
-        if chat:
-            return chat.display_name
-        return self.sender_name
+        title = self._chat_title_cache
+        if title is None:
+            client = self._client
+            chat = client.get_chat(self.chat_id) if client else None
+            if not chat:
+                return self.sender_name
+            title = chat.title
+            if not title:
+                return chat.display_name
+            self._chat_title_cache = title
+        return title
     
-    async def reply(self, text: str) -> Optional["Message"]:
-        if hasattr(self, '_client') and self._client:
-            return await self._client.send_message(self.chat_id, text, reply_to=self.id)
-        raise RuntimeError("Message not bound to client")
+    async def reply(self, text: str) -> Optional[Message]:
+        return await self._require_client().send_message(self.chat_id, text, reply_to=self.id)
     
-    async def reply_sticker(self, sticker_id: int) -> Optional["Message"]:
-        if hasattr(self, '_client') and self._client:
-            return await self._client.send_sticker(self.chat_id, sticker_id, reply_to=self.id)
-        raise RuntimeError("Message not bound to client")
+    async def reply_sticker(self, sticker_id: int) -> Optional[Message]:
+        return await self._require_client().send_sticker(self.chat_id, sticker_id, reply_to=self.id)
     
     async def react(self, reaction: str = "👍") -> None:
-        if hasattr(self, '_client') and self._client:
-            return await self._client.send_reaction(self.chat_id, self.id, reaction)
-        raise RuntimeError("Message not bound to client")
+        return await self._require_client().send_reaction(self.chat_id, self.id, reaction)
     
-    async def edit(self, text: str) -> Optional["Message"]:
-        if hasattr(self, '_client') and self._client:
-            return await self._client.edit_message(self.chat_id, self.id, text)
-        raise RuntimeError("Message not bound to client")
\ No newline at end of file
+    async def edit(self, text: str) -> Optional[Message]:
+        return await self._require_client().edit_message(self.chat_id, self.id, text)
\ No newline at end of file
@@ -1,7 +1,13 @@
-from typing import Optional
+from __future__ import annotations
+
+from dataclasses import field
+from typing import Optional, TYPE_CHECKING
 
 from ..base import MaximusType
 
+if TYPE_CHECKING:
+    from maximus.client import MaxClient
+
 
 class User(MaximusType):
     id: int
@@ -10,4 +16,5 @@ class User(MaximusType):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     photo_id: Optional[int] = None
-    base_url: Optional[str] = None
\ No newline at end of file
+    base_url: Optional[str] = None
+    _client: Optional[MaxClient] = field(default=None, init=False, repr=False, compare=False)
\ No newline at end of file
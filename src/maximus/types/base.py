@@ -1,14 +1,173 @@
-from dataclasses import dataclass
-from typing import Any
+from __future__ import annotations
 
-try:
-    from typing import dataclass_transform
-except ImportError:
-    # For Python < 3.11
-    def dataclass_transform(**kwargs):
-        def decorator(cls):
-            return cls
-        return decorator
+from dataclasses import MISSING, Field, dataclass, fields
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Self, Sequence, Tuple, TYPE_CHECKING, dataclass_transform
+
+if TYPE_CHECKING:
+    from maximus.client import MaxClient
+
+
+# Placeholder names for unresolved users/chats; cached so repeated renders share one string
+@lru_cache(maxsize=4096)
+def _user_fallback_name(user_id: int) -> str:
+    """Return the display name for a user that isn't loaded."""
+    return f"User {user_id}"
+
+
+@lru_cache(maxsize=4096)
+def _chat_fallback_name(chat_id: int) -> str:
+    """Return the display name for a chat without a title."""
+    return f"Chat {chat_id}"
+
+
+def _private_slots(class_: Any) -> Tuple[str, ...]:
+    """Return the names of the private (non-field) slots of a class and its bases."""
+    return tuple(
+        name
+        for base in reversed(class_.__mro__)
+        for name in base.__dict__.get("__slots__", ())
+        if name.startswith("_") and not name.startswith("__")
+    )
+
+
+def _add_slots(class_: Any, private: Sequence[str]) -> Any:
+    """Rebuild a dataclass with slots for its fields and its private attributes."""
+    # Same as dataclass(slots=True), which only knows about the fields
+    inherited = {
+        name for base in class_.__mro__[1:] for name in base.__dict__.get("__slots__", ())
+    }
+    field_names = [f.name for f in fields(class_)]
+    class_dict = dict(class_.__dict__)
+    class_dict["__slots__"] = tuple(
+        name for name in (*field_names, *private, "__weakref__") if name not in inherited
+    )
+    for name in field_names:
+        class_dict.pop(name, None)
+    class_dict.pop("__dict__", None)
+    class_dict.pop("__weakref__", None)
+    slotted = type(class_)(class_.__name__, class_.__bases__, class_dict)
+    slotted.__qualname__ = class_.__qualname__
+    return slotted
+
+
+def _build_init(class_: Any) -> None:
+    """Replace the dataclass __init__ with one that writes the slots directly."""
+    # dataclass looks up object.__setattr__ through an attribute on every frozen field write,
+    # and knows nothing about the private slots, which always start out as None
+    frozen = class_.__dataclass_params__.frozen
+    params = []
+    lines = []
+    namespace: Dict[str, Any] = {"_setattr": object.__setattr__, "_FACTORY": object()}
+    for f in fields(class_):
+        if f.default is not MISSING:
+            namespace[f"_dflt_{f.name}"] = f.default
+            param = f"{f.name}=_dflt_{f.name}"
+            value = f.name if f.init else f"_dflt_{f.name}"
+        elif f.default_factory is not MISSING:
+            namespace[f"_fact_{f.name}"] = f.default_factory
+            param = f"{f.name}=_FACTORY"
+            if f.init:
+                value = f"_fact_{f.name}() if {f.name} is _FACTORY else {f.name}"
+            else:
+                value = f"_fact_{f.name}()"
+        elif f.init:
+            param = value = f.name
+        else:
+            continue
+        if f.init:
+            params.append(param)
+        lines.append(_assign(f.name, value, frozen))
+    lines.extend(_assign(name, "None", frozen) for name in _private_slots(class_))
+    if hasattr(class_, "__post_init__"):
+        lines.append("    self.__post_init__()")
+    
+    signature = f"self, *, {', '.join(params)}" if params else "self"
+    source = f"def __init__({signature}) -> None:\n" + ("\n".join(lines) or "    pass")
+    exec(source, namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{class_.__qualname__}.__init__"
+    init.__module__ = class_.__module__
+    class_.__init__ = init
+
+
+def _assign(name: str, value: str, frozen: bool) -> str:
+    """Return a generated source line that stores a value in a slot."""
+    # Mutable types take plain slot stores; frozen ones go around the frozen __setattr__
+    return f"    _setattr(self, {name!r}, {value})" if frozen else f"    self.{name} = {value}"
+
+
+def _build_state_methods(class_: Any) -> None:
+    """Attach __getstate__/__setstate__ that carry only the fields."""
+    # Copies and pickles leave the bound client and caches behind; restored objects are unbound
+    names = tuple(f.name for f in fields(class_))
+    private = _private_slots(class_)
+    
+    def __getstate__(self: Any) -> List[Any]:
+        return [getattr(self, name) for name in names]
+    
+    def __setstate__(self: Any, state: List[Any]) -> None:
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+        for name in private:
+            object.__setattr__(self, name, None)
+    
+    for method in (__getstate__, __setstate__):
+        if method.__name__ not in class_.__dict__:
+            method.__qualname__ = f"{class_.__qualname__}.{method.__name__}"
+            method.__module__ = class_.__module__
+            setattr(class_, method.__name__, method)
+
+
+def _build_dict_methods(class_: Any) -> None:
+    """Attach to_dict/from_dict and _from_raw that read and write the slots directly."""
+    # Private slots aren't serialized; both constructors take the client separately
+    frozen = class_.__dataclass_params__.frozen
+    items = []
+    params = []
+    dict_lines = ["    self = _new(cls)", "    get = data.get"]
+    raw_lines = ["    self = _new(cls)"]
+    namespace: Dict[str, Any] = {"_new": object.__new__, "_setattr": object.__setattr__}
+    for f in fields(class_):
+        items.append(f"{f.name!r}: self.{f.name}")
+        params.append(f.name)
+        if f.default is not MISSING:
+            namespace[f"_dflt_{f.name}"] = f.default
+            dict_value = f"get({f.name!r}, _dflt_{f.name})"
+        elif f.default_factory is not MISSING:
+            namespace[f"_fact_{f.name}"] = f.default_factory
+            dict_value = f"data[{f.name!r}] if {f.name!r} in data else _fact_{f.name}()"
+        else:
+            dict_value = f"data[{f.name!r}]"
+        dict_lines.append(_assign(f.name, dict_value, frozen))
+        raw_lines.append(_assign(f.name, f.name, frozen))
+    for name in _private_slots(class_):
+        value = "client" if name == "_client" else "None"
+        dict_lines.append(_assign(name, value, frozen))
+        raw_lines.append(_assign(name, value, frozen))
+    dict_lines.append("    return self")
+    raw_lines.append("    return self")
+    
+    source = (
+        f"def to_dict(self):\n    return {{{', '.join(items)}}}\n"
+        "def from_dict(cls, data, client=None):\n" + "\n".join(dict_lines) + "\n"
+        f"def _from_raw(cls, {''.join(p + ', ' for p in params)}client=None):\n"
+        + "\n".join(raw_lines)
+    )
+    exec(source, namespace)
+    namespace["to_dict"].__doc__ = "Return the fields as a shallow dict."
+    namespace["from_dict"].__doc__ = "Build an instance from a dict produced by to_dict()."
+    namespace["_from_raw"].__doc__ = "Build an instance from the fields, in declaration order."
+    for method_name in ("to_dict", "from_dict", "_from_raw"):
+        method = namespace[method_name]
+        method.__qualname__ = f"{class_.__qualname__}.{method_name}"
+        method.__module__ = class_.__module__
+    # A subclass that writes its own version keeps it
+    if "to_dict" not in class_.__dict__:
+        class_.to_dict = namespace["to_dict"]
+    for method_name in ("from_dict", "_from_raw"):
+        if method_name not in class_.__dict__:
+            setattr(class_, method_name, classmethod(namespace[method_name]))
 
 
 @dataclass_transform(
@@ -21,18 +180,61 @@ class _MaximusTypeMetaClass(type):
         name: str,
         bases: tuple[Any, ...],
         namespace: dict[str, Any],
+        *,
+        frozen: Optional[bool] = None,
+        **kwargs: Any,
     ) -> Any:
-        class_ = super().__new__(cls, name, bases, namespace)
-        if "__slots__" in namespace:
+        class_: Any = super().__new__(cls, name, bases, namespace, **kwargs)
+        # The root stays a plain class; _add_slots re-enters here to rebuild the class
+        if not bases or "__dataclass_fields__" in namespace:
             return class_
-
-        return dataclass(
-            slots=True,
-            frozen=True,
-            kw_only=True,
-        )(class_)
+        
+        # Underscore-prefixed attributes (the bound client, caches) are per-instance state
+        # rather than fields: they get slots of their own, start out as None, and stay out of
+        # __init__, repr, eq, fields(), to_dict() and copies
+        annotations = class_.__dict__.get("__annotations__", {})
+        private = [attr for attr in annotations if attr.startswith("_")]
+        for attr in private:
+            del annotations[attr]
+            value = class_.__dict__.get(attr)
+            if isinstance(value, Field):
+                value = value.default
+            if value is not None:
+                raise TypeError(f"private attribute {name}.{attr} must default to None")
+            if attr in class_.__dict__:
+                delattr(class_, attr)
+        
+        # Types updated after construction pass `frozen=False`; subclasses inherit the parent's
+        if frozen is None:
+            params = getattr(class_, "__dataclass_params__", None)
+            frozen = params.frozen if params is not None else True
+        class_ = dataclass(frozen=frozen, kw_only=True)(class_)
+        class_ = _add_slots(class_, private)
+        _build_init(class_)
+        _build_dict_methods(class_)
+        _build_state_methods(class_)
+        return class_
 
 
 class MaximusType(metaclass=_MaximusTypeMetaClass):
     """Base type for all Maximus types."""
-    pass
\ No newline at end of file
+    # Not a dataclass itself, so frozen and mutable subclasses can share it
+    __slots__ = ()
+    
+    def _require_client(self) -> MaxClient:
+        """Return the bound client, or raise if there is none."""
+        client: Optional[MaxClient] = getattr(self, "_client", None)
+        if client is None:
+            raise RuntimeError(f"{type(self).__name__} not bound to client")
+        return client
+    
+    if TYPE_CHECKING:
+        # The metaclass attaches the real methods to every subclass
+        def to_dict(self) -> Dict[str, Any]: ...
+        
+        @classmethod
+        def from_dict(cls, data: Dict[str, Any], client: Optional[MaxClient] = None) -> Self: ...
+        
+        # Positional public fields in declaration order, then the client; used by the mappers
+        @classmethod
+        def _from_raw(cls, *values: Any) -> Self: ...
\ No newline at end of file
@@ -0,0 +1,200 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError, asdict, fields
+
+import pytest
+
+from maximus.types import Chat, ChatType, MaximusType, Message, User
+
+
+def make_user() -> User:
+    return User(id=1, phone=79990000000, name="Alice Smith", first_name="Alice", last_name="Smith")
+
+
+def make_chat() -> Chat:
+    return Chat(
+        id=10,
+        type=ChatType.DIALOG,
+        title="Alice",
+        participants=frozenset({1, 2}),
+        last_message=make_message(),
+        owner=1,
+        created=100,
+        modified=200,
+    )
+
+
+def make_message() -> Message:
+    return Message(
+        id="m1",
+        text="hello",
+        sender=1,
+        time=1700000000,
+        chat_id=10,
+        attaches=({"_type": "PHOTO"},),
+    )
+
+
+class TestInit:
+    def test_defaults(self) -> None:
+        user = User(id=1)
+        assert user.phone is None
+        assert user.name is None
+        assert user.base_url is None
+
+        chat = Chat(id=10, type=ChatType.CHAT)
+        assert chat.title is None
+        assert chat.participants == frozenset()
+        assert chat.last_message is None
+        assert chat.status == "ACTIVE"
+
+        message = Message(id="m1", text="", sender=1, time=0, chat_id=10)
+        assert message.type == "USER"
+        assert message.attaches == ()
+
+    def test_private_attributes_start_unset(self) -> None:
+        assert make_user()._client is None
+        assert make_chat()._display_name_cache is None
+        message = make_message()
+        assert message._client is None
+        assert message._chat_cache is None
+        assert message._sender_name_cache is None
+
+    @pytest.mark.parametrize("type_", [User, Chat, Message])
+    def test_keyword_only(self, type_: type) -> None:
+        with pytest.raises(TypeError):
+            type_(1)
+
+    @pytest.mark.parametrize("type_", [User, Chat, Message])
+    def test_missing_required_field(self, type_: type) -> None:
+        with pytest.raises(TypeError, match="missing"):
+            type_()
+
+    def test_private_attributes_are_not_parameters(self) -> None:
+        with pytest.raises(TypeError):
+            User(id=1, _client=object())  # type: ignore[call-arg]
+
+
+class TestFrozen:
+    def test_user_is_frozen(self) -> None:
+        user = make_user()
+        with pytest.raises(FrozenInstanceError):
+            user.name = "Bob"  # type: ignore[misc]
+
+    def test_chat_and_message_are_mutable(self) -> None:
+        chat = make_chat()
+        chat.title = "Renamed"
+        assert chat.title == "Renamed"
+
+        message = make_message()
+        message.text = "edited"
+        assert message.text == "edited"
+
+    def test_subclass_inherits_frozenness(self) -> None:
+        class MyUser(User):
+            extra: int = 0
+
+        class MyChat(Chat):
+            extra: int = 0
+
+        with pytest.raises(FrozenInstanceError):
+            MyUser(id=1).name = "Bob"  # type: ignore[misc]
+        chat = MyChat(id=10, type=ChatType.CHAT, extra=5)
+        chat.title = "Renamed"
+        assert (chat.title, chat.extra) == ("Renamed", 5)
+
+    def test_frozen_keyword(self) -> None:
+        class Point(MaximusType, frozen=False):
+            x: int = 0
+
+        class FrozenPoint(MaximusType):
+            x: int = 0
+
+        point = Point()
+        point.x = 1
+        assert point.x == 1
+        with pytest.raises(FrozenInstanceError):
+            FrozenPoint().x = 1  # type: ignore[misc]
+
+
+class TestDictRoundTrip:
+    @pytest.mark.parametrize("factory", [make_user, make_chat, make_message])
+    def test_round_trip(self, factory: object) -> None:
+        obj = factory()  # type: ignore[operator]
+        assert type(obj).from_dict(obj.to_dict()) == obj
+
+    def test_to_dict_is_shallow(self) -> None:
+        chat = make_chat()
+        data = chat.to_dict()
+        assert data["last_message"] is chat.last_message
+        assert data["participants"] is chat.participants
+
+    def test_to_dict_skips_private_attributes(self) -> None:
+        assert list(make_user().to_dict()) == [
+            "id", "phone", "name", "first_name", "last_name", "photo_id", "base_url",
+        ]
+
+    def test_from_dict_fills_defaults(self) -> None:
+        chat = Chat.from_dict({"id": 10, "type": ChatType.DIALOG})
+        assert chat == Chat(id=10, type=ChatType.DIALOG)
+
+    def test_from_dict_requires_fields_without_defaults(self) -> None:
+        with pytest.raises(KeyError):
+            User.from_dict({"name": "Alice"})
+
+    def test_from_dict_binds_client(self) -> None:
+        client = object()
+        message = Message.from_dict(make_message().to_dict(), client)  # type: ignore[arg-type]
+        assert message._client is client
+        assert message._chat_cache is None
+
+    def test_from_raw_matches_init(self) -> None:
+        client = object()
+        message = make_message()
+        raw = Message._from_raw(*message.to_dict().values(), client)
+        assert raw == message
+        assert raw._client is client
+
+        user = make_user()
+        assert User._from_raw(*user.to_dict().values()) == user
+
+
+class TestPrivateState:
+    def make_bound_message(self) -> Message:
+        message = Message.from_dict(make_message().to_dict(), object())  # type: ignore[arg-type]
+        message._sender_name_cache = "Alice"
+        message._chat_title_cache = "Alice"
+        return message
+
+    def test_not_dataclass_fields(self) -> None:
+        message = self.make_bound_message()
+        names = {f.name for f in fields(message)}
+        assert not {name for name in names if name.startswith("_")}
+        assert "_client" not in asdict(message)
+        assert "_display_name_cache" not in asdict(make_chat())
+
+    def test_not_in_repr_or_eq(self) -> None:
+        message = self.make_bound_message()
+        assert "_client" not in repr(message)
+        assert message == make_message()
+
+    @pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy])
+    def test_copies_are_unbound(self, copier: object) -> None:
+        message = self.make_bound_message()
+        copied = copier(message)  # type: ignore[operator]
+        assert copied == message
+        assert copied._client is None
+        assert copied._sender_name_cache is None
+        assert copied._chat_title_cache is None
+
+    def test_pickle_skips_client(self) -> None:
+        message = self.make_bound_message()
+        restored = pickle.loads(pickle.dumps(message))
+        assert restored == message
+        assert restored._client is None
+        assert pickle.loads(pickle.dumps(make_user())) == make_user()
+
+    def test_private_default_must_be_none(self) -> None:
+        with pytest.raises(TypeError, match="must default to None"):
+            class Bad(MaximusType):
+                _count: int = 0